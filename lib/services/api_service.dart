@@ -4,10 +4,13 @@ import 'dart:convert';
 class ApiService {
   static const String baseUrl = 'http://z.zsyyyds.top';
 
+  // 复用同一个 Client，保持 keep-alive 连接，避免每次请求重新握手
+  static final http.Client _client = http.Client();
+
   static Future<Map<String, dynamic>> fetchCaptcha() async {
-    final response = await http.get(Uri.parse('$baseUrl/captcha'));
+    final response = await _client.get(Uri.parse('$baseUrl/captcha'));
     if (response.statusCode == 200) {
-      return jsonDecode(response.body);
+      return jsonDecode(utf8.decode(response.bodyBytes));
     } else {
       throw Exception('获取验证码失败');
     }
@@ -19,7 +22,7 @@ class ApiService {
     required String password,
     required String captcha,
   }) async {
-    final response = await http.post(
+    final response = await _client.post(
       Uri.parse('$baseUrl/timetable'),
       headers: {'Content-Type': 'application/json'},
       body: jsonEncode({
@@ -29,7 +32,7 @@ class ApiService {
         'captcha': captcha,
       }),
     );
-    return jsonDecode(response.body);
+    return jsonDecode(utf8.decode(response.bodyBytes));
   }
 
   static Future<Map<String, dynamic>> fetchSemesterWeeks({
@@ -49,12 +52,12 @@ class ApiService {
       'max_weeks': maxWeeks,
     };
 
-    final response = await http.post(
+    final response = await _client.post(
       Uri.parse('$baseUrl/timetable/semester-weeks'),
       headers: {'Content-Type': 'application/json'},
       body: jsonEncode(body),
     );
-    final respBody = jsonDecode(response.body);
+    final respBody = jsonDecode(utf8.decode(response.bodyBytes));
     if (response.statusCode >= 400) {
       throw Exception(respBody['detail'] ?? '获取学期课表失败');
     }